@@ -0,0 +1,34 @@
+"""Compact JSON encoding and decoding for request/response bodies.
+
+Uses orjson when it is installed and falls back to a reused stdlib encoder
+with compact separators otherwise. Both give the same output for the ASCII
+text and str keys this library sends; they differ for non-ASCII text (the
+stdlib escapes it) and for non-str keys (orjson rejects them).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - optional dependency handling
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - orjson not available
+    orjson = None  # type: ignore[assignment]
+
+# Compact separators keep large animData payloads from growing by a space per key.
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)  # type: ignore[no-any-return]
+    return _ENCODER.encode(obj).encode()
+
+
+def loads(data: bytes) -> Any:
+    """Decode a JSON body read as raw bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -11,13 +11,42 @@ Features:
 from __future__ import annotations
 
 import asyncio
+import logging
+import struct
+import warnings
 from contextlib import suppress
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Tuple, Optional
+from functools import cached_property, lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple, Union
 
+from aionanoleaf._json import dumps
 from aionanoleaf.effects import EffectsClient  # top-level import
 
+_LOGGER = logging.getLogger(__name__)
+
 RGB = Tuple[int, int, int]
+_SUBSET_CACHE_SIZE = 64
+_RGB_STRUCT = struct.Struct("BBB")
+# Fixed-point c * bn / 100: (c * bn * 5243 + 2**18) >> 19 equals
+# (c * bn + 50) // 100 for every c in 0..255 and bn in 0..100.
+_SCALE_MUL = 5243
+_SCALE_SHIFT = 19
+_SCALE_HALF = 1 << (_SCALE_SHIFT - 1)
+# Decimal text of every channel value, so rendering never calls int.__str__.
+_DEC: Tuple[str, ...] = tuple(str(i) for i in range(256))
+# Static parts of the /effects write payload, one template per command.
+# sync() copies these shallowly, so the palette is an (immutable) empty
+# tuple shared by every payload; both JSON encoders write it as [].
+_PAYLOAD_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    command: {
+        "command": command,
+        "version": "1.0",
+        "animType": "static",
+        "palette": (),
+        "loop": False,
+    }
+    for command in ("display", "displayTemp")
+}
 __all__ = ["DigitalTwin", "_build_anim"]
 
 
@@ -32,6 +61,12 @@ def _validate_rgb(rgb: RGB) -> RGB:
     Note: This function *does not* error on out-of-range values; it clamps them.
     This matches test expectations, e.g. (0, 0, 300) → (0, 0, 255).
     """
+    # Fast path: an in-range tuple of plain ints is returned unchanged.
+    # pylint: disable=unidiomatic-typecheck
+    if type(rgb) is tuple and len(rgb) == 3 and all(type(c) is int for c in rgb):
+        r, g, b = rgb
+        if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
+            return rgb
     try:
         r, g, b = (int(rgb[0]), int(rgb[1]), int(rgb[2]))
     except Exception as exc:  # noqa: BLE001 (defensive parse)
@@ -46,47 +81,111 @@ def _hex_to_rgb(s: str) -> RGB:
     s = s.strip()
     if s.startswith("#"):
         s = s[1:]
+    # "#FF0000", "ff0000" and " #ff0000 " all share one cache entry.
+    return _hex_to_rgb_cached(s.lower())
+
+
+@lru_cache(maxsize=1024)
+def _hex_to_rgb_cached(s: str) -> RGB:
+    """Parse a normalised (lowercase, no '#') RRGGBB string."""
     if len(s) != 6:
         raise ValueError("hex must be #RRGGBB")
-    r = int(s[0:2], 16)
-    g = int(s[2:4], 16)
-    b = int(s[4:6], 16)
-    return r, g, b
+    try:
+        return _RGB_STRUCT.unpack(bytes.fromhex(s))
+    except (ValueError, struct.error) as exc:
+        raise ValueError("hex must be #RRGGBB") from exc
 
 
-def _apply_brightness(rgb: RGB, brightness: Optional[int]) -> RGB:
-    """Apply optional brightness overlay (0..100) to RGB."""
+def _brightness_factor(brightness: Optional[int]) -> Optional[int]:
+    """Validate a brightness overlay; None when no scaling is needed."""
     if brightness is None:
-        return rgb
-    if not 0 <= int(brightness) <= 100:
+        return None
+    bn = int(brightness)
+    if not 0 <= bn <= 100:
         raise ValueError("brightness must be between 0 and 100")
-    if brightness == 100:
+    return None if bn == 100 else bn
+
+
+def _apply_brightness(rgb: RGB, brightness: Optional[int]) -> RGB:
+    """Apply optional brightness overlay (0..100) to RGB."""
+    bn = _brightness_factor(brightness)
+    if bn is None:
         return rgb
-    scale = brightness / 100.0
+    k = bn * _SCALE_MUL
     r, g, b = rgb
-    return (_clamp(round(r * scale)), _clamp(round(g * scale)), _clamp(round(b * scale)))
+    return (
+        (r * k + _SCALE_HALF) >> _SCALE_SHIFT,
+        (g * k + _SCALE_HALF) >> _SCALE_SHIFT,
+        (b * k + _SCALE_HALF) >> _SCALE_SHIFT,
+    )
+
+
+@lru_cache(maxsize=None)
+def _brightness_table(bn: int) -> bytes:
+    """256-entry translate table scaling a channel by bn/100 (round half up)."""
+    k = bn * _SCALE_MUL
+    return bytes((c * k + _SCALE_HALF) >> _SCALE_SHIFT for c in range(256))
+
+
+def _record_prefix(pid: int) -> str:
+    """Invariant start of a panel's animData record: "<id> 1 " (one frame)."""
+    return f"{pid} 1 "
+
+
+def _format_anim(
+    prefixes: Sequence[str], cols: Union[bytes, bytearray], transition: int
+) -> str:
+    """Render animData from record prefixes and their packed R,G,B rows."""
+    # Everything after the colour is shared by all records.
+    suffix = f" 0 {max(0, int(transition))}"
+    dec = _DEC
+    # Walk the prefixes and packed colour rows in lockstep: no per-panel
+    # dict lookups or index arithmetic in the hot loop.
+    it = iter(cols)
+    parts: List[str] = [str(len(prefixes))]
+    append = parts.append
+    for prefix, r, g, b in zip(prefixes, it, it, it):
+        append(f"{prefix}{dec[r]} {dec[g]} {dec[b]}{suffix}")
+    return " ".join(parts)
 
 
 def _build_anim(
     ids: Iterable[int],
-    colours: Dict[int, RGB],
+    colours: Union[Mapping[int, RGB], Sequence[RGB]],
     transition: int = 10,
     *,
     brightness: Optional[int] = None,
 ) -> str:
-    """Build Nanoleaf 'static' effect animData string: N [id] 1 R G B 0 T ..."""
-    id_list = list(ids)
-    records: List[int] = []
-    t = int(max(0, transition))
-    for panel_id in id_list:
-        r, g, b = _apply_brightness(colours[panel_id], brightness)
-        records += [int(panel_id), 1, int(r), int(g), int(b), 0, t]
-    return " ".join(map(str, [len(id_list)] + records))
+    """Build Nanoleaf 'static' effect animData string: N [id] 1 R G B 0 T ...
 
+    colours is either an {id: rgb} mapping or a sequence of rgb already in
+    ids order. Colour channels must already be in 0..255 (see _validate_rgb).
+    """
+    id_list = list(ids)
+    bn = _brightness_factor(brightness)
+    rgbs: Iterable[RGB]
+    if isinstance(colours, Mapping):
+        rgbs = [colours[pid] for pid in id_list]
+    elif len(colours) != len(id_list):
+        raise ValueError(f"expected {len(id_list)} colours, got {len(colours)}")
+    else:
+        rgbs = colours
+    # Pack all channels once so brightness is a single translate() pass.
+    cols = bytes(chain.from_iterable(rgbs))
+    if len(cols) != 3 * len(id_list):
+        raise ValueError("every colour must be an (r, g, b) triple")
+    if bn is not None:
+        cols = cols.translate(_brightness_table(bn))
+    return _format_anim([_record_prefix(pid) for pid in id_list], cols, transition)
+
+
+# Layout helpers hand the twin plain (panel_id, x, y) tuples.
+_PanelRow = Tuple[int, int, int]
+
+
+class _Panel(NamedTuple):
+    """Minimal panel record; any (panel_id, x, y) tuple works in its place."""
 
-@dataclass  # data container; keep tiny
-class _Panel:  # pylint: disable=too-few-public-methods
-    """Minimal panel record."""
     panel_id: int
     x: int
     y: int
@@ -94,9 +193,9 @@ class _Panel:  # pylint: disable=too-few-public-methods
 
 # ----------------------------- layout helpers ----------------------------- #
 
-def _extract_from_position_list(pos: Any) -> List[_Panel]:
-    """Convert positionData list into _Panel records."""
-    panels: List[_Panel] = []
+def _extract_from_position_list(pos: Any) -> List[_PanelRow]:
+    """Convert positionData list into (panel_id, x, y) rows."""
+    panels: List[_PanelRow] = []
     if isinstance(pos, list):
         for p in pos:
             if not isinstance(p, dict):
@@ -105,7 +204,7 @@ def _extract_from_position_list(pos: Any) -> List[_Panel]:
             x = p.get("x")
             y = p.get("y")
             if pid is not None and x is not None and y is not None:
-                panels.append(_Panel(int(pid), int(x), int(y)))
+                panels.append((int(pid), int(x), int(y)))
     return panels
 
 
@@ -118,7 +217,7 @@ async def _maybe_populate_info(nl: Any) -> None:
             await res
 
 
-async def _get_layout_positions(nl: Any) -> List[_Panel]:
+async def _get_layout_positions(nl: Any) -> List[_PanelRow]:
     """Try explicit layout endpoints (preferred)."""
     layout = None
     if callable(getattr(nl, "get_panel_layout", None)):
@@ -131,7 +230,7 @@ async def _get_layout_positions(nl: Any) -> List[_Panel]:
     return []
 
 
-def _get_info_positions(nl: Any) -> List[_Panel]:
+def _get_info_positions(nl: Any) -> List[_PanelRow]:
     """Try info/_info dicts for panelLayout.layout.positionData."""
     info = getattr(nl, "info", None) or getattr(nl, "_info", None)
     if not isinstance(info, dict):
@@ -147,10 +246,10 @@ def _get_info_positions(nl: Any) -> List[_Panel]:
     return _extract_from_position_list(pos)
 
 
-def _get_object_positions(nl: Any) -> List[_Panel]:
+def _get_object_positions(nl: Any) -> List[_PanelRow]:
     """Fallback: infer from nl.panels/_panels objects with id/x/y attributes."""
     candidates = getattr(nl, "panels", None) or getattr(nl, "_panels", None)
-    panels: List[_Panel] = []
+    panels: List[_PanelRow] = []
     if not isinstance(candidates, (list, tuple)):
         return panels
 
@@ -169,25 +268,95 @@ def _get_object_positions(nl: Any) -> List[_Panel]:
             y = getattr(obj, "y_coordinate", None)
 
         if pid is not None and x is not None and y is not None:
-            panels.append(_Panel(int(pid), int(x), int(y)))
+            panels.append((int(pid), int(x), int(y)))
     return panels
 
 
+def _resolve_writer(nl: Any) -> Callable[[Dict[str, Any]], Any]:
+    """Return the client's /effects write method, checked once per twin.
+
+    Clients exposing _put_raw(path, body) get the encoded body directly,
+    skipping their own JSON encoding.
+    """
+    put_raw = getattr(nl, "_put_raw", None)
+    if callable(put_raw):
+        async def _write_raw(payload: Dict[str, Any]) -> None:
+            await put_raw("/effects", dumps({"write": payload}))
+        return _write_raw
+    for name in ("write_effect", "effects_write", "display_effect"):
+        meth = getattr(nl, name, None)
+        if callable(meth):
+            return meth
+    raise RuntimeError(
+        "Nanoleaf client does not expose a write_effect/effects_write/display_effect method."
+    )
+
+
+def _warn_async_setter(name: str) -> None:
+    """Flag a call to one of the deprecated aset_* aliases."""
+    warnings.warn(
+        f"DigitalTwin.a{name}() is deprecated; call the synchronous {name}() without await",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
 # --------------------------------- twin ---------------------------------- #
 
+class _ColourView(Mapping[int, RGB]):
+    """Live read-only {id: (r, g, b)} view over a twin's packed colour store."""
+
+    __slots__ = ("_twin",)
+
+    def __init__(self, twin: "DigitalTwin") -> None:
+        self._twin = twin
+
+    def __getitem__(self, panel_id: int) -> RGB:
+        try:
+            return self._twin.get_color(panel_id)
+        except (TypeError, ValueError) as exc:
+            raise KeyError(panel_id) from exc
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._twin._ids_ordered)  # pylint: disable=protected-access
+
+    def __len__(self) -> int:
+        return len(self._twin._ids_ordered)  # pylint: disable=protected-access
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._twin.get_all_colors()!r})"
+
+
 class DigitalTwin:
     """Per-panel static colour control via REST Effects write."""
 
-    def __init__(self, nl: Any, panels: List[_Panel]) -> None:
+    def __init__(self, nl: Any, panels: Iterable[_PanelRow]) -> None:
         """Create a twin given a Nanoleaf client and panel list."""
         self._nl = nl
-        # Deterministic order: x asc, then y asc, then id asc
-        panels_sorted = sorted(panels, key=lambda p: (p.x, p.y, p.panel_id))
-        self._ids_ordered: Tuple[int, ...] = tuple(p.panel_id for p in panels_sorted)
-        self._ids_set = set(self._ids_ordered)
-        self.colors: Dict[int, RGB] = {pid: (0, 0, 0) for pid in self._ids_ordered}
-        # NEW: remember positions for region helpers
-        self._pos: Dict[int, Tuple[int, int]] = {p.panel_id: (p.x, p.y) for p in panels_sorted}
+        self._write_effect = _resolve_writer(nl)
+        # Deterministic order: x asc, then y asc, then id asc. Sorting plain
+        # (x, y, id) tuples keeps the comparisons in C.
+        order = sorted([(x, y, pid) for pid, x, y in panels])
+        self._ids_ordered: Tuple[int, ...] = tuple(pid for _, _, pid in order)
+        # Coordinates in the same order, for the region helpers.
+        self._xs: Tuple[int, ...] = tuple(x for x, _, _ in order)
+        self._ys: Tuple[int, ...] = tuple(y for _, y, _ in order)
+        # IDs never change after construction; format their record prefixes once.
+        self._prefixes: Tuple[str, ...] = tuple(_record_prefix(pid) for pid in self._ids_ordered)
+        self._id_index: Dict[int, int] = {pid: i for i, pid in enumerate(self._ids_ordered)}
+        # Packed colour store: row i holds R,G,B of self._ids_ordered[i].
+        self._rgb = bytearray(3 * len(self._ids_ordered))
+        # only= selections seen by sync(), e.g. repeated blink patterns
+        self._subset_cache: Dict[FrozenSet[int], Tuple[int, ...]] = {}
+        # Rendered colours of the last full "display" write; None when unknown.
+        self._last_sent: Optional[bytes] = None
+        # Cleared by a full "display" write, set again by every colour setter.
+        self._dirty = True
+        self._last_brightness: Optional[int] = None
+        # schedule_sync() state: pending timer, running tasks, lazily created lock
+        self._pending_sync: Optional[asyncio.TimerHandle] = None
+        self._sync_tasks: Set["asyncio.Task[None]"] = set()
+        self._sync_lock: Optional[asyncio.Lock] = None
 
     @classmethod
     async def create(cls, nl: Any) -> "DigitalTwin":
@@ -220,13 +389,25 @@ class DigitalTwin:
         """List of panel IDs in deterministic (x,y,id) order."""
         return list(self._ids_ordered)
 
+    @cached_property
+    def colors(self) -> Mapping[int, RGB]:
+        """Live read-only view of the twin colours as {id: (r, g, b)}.
+
+        Lookups read the packed store directly. Edit colours with
+        set_color()/set_colors(); use get_all_colors() for a mutable copy.
+        """
+        return _ColourView(self)
+
     def get_color(self, panel_id: int) -> RGB:
         """Get the current RGB assigned to a panel in the twin."""
-        return self.colors[int(panel_id)]
+        j = 3 * self._id_index[int(panel_id)]
+        rgb = self._rgb
+        return rgb[j], rgb[j + 1], rgb[j + 2]
 
     def get_all_colors(self) -> Dict[int, RGB]:
         """Get a copy of the whole twin colour map."""
-        return dict(self.colors)
+        it = iter(self._rgb)
+        return dict(zip(self._ids_ordered, zip(it, it, it)))
 
     # ---------- NEW: Region selection helpers ----------
 
@@ -234,45 +415,138 @@ class DigitalTwin:
         """IDs whose (x,y) are within the inclusive bounding box."""
         x0, x1 = (int(min(x_min, x_max)), int(max(x_min, x_max)))
         y0, y1 = (int(min(y_min, y_max)), int(max(y_min, y_max)))
-        sel = [pid for pid in self._ids_ordered
-               if (x0 <= self._pos[pid][0] <= x1) and (y0 <= self._pos[pid][1] <= y1)]
-        return sel
+        return [pid for pid, x, y in zip(self._ids_ordered, self._xs, self._ys)
+                if x0 <= x <= x1 and y0 <= y <= y1]
 
     def ids_by_row(self, y: int, tolerance: int = 10) -> List[int]:
         """IDs whose y is within ±tolerance of the given row y."""
         y = int(y)
         tol = max(0, int(tolerance))
         y0, y1 = y - tol, y + tol
-        return [pid for pid in self._ids_ordered if y0 <= self._pos[pid][1] <= y1]
+        return [pid for pid, y_pos in zip(self._ids_ordered, self._ys) if y0 <= y_pos <= y1]
 
     def ids_by_col(self, x: int, tolerance: int = 10) -> List[int]:
         """IDs whose x is within ±tolerance of the given column x."""
         x = int(x)
         tol = max(0, int(tolerance))
         x0, x1 = x - tol, x + tol
-        return [pid for pid in self._ids_ordered if x0 <= self._pos[pid][0] <= x1]
+        return [pid for pid, x_pos in zip(self._ids_ordered, self._xs) if x0 <= x_pos <= x1]
 
     # ---------- Editing ----------
 
-    async def set_color(self, panel_id: int, rgb: RGB) -> None:
+    def set_color(self, panel_id: int, rgb: RGB) -> None:
         """Set RGB for a single panel ID."""
         panel_id = int(panel_id)
-        if panel_id not in self._ids_set:
+        row = self._id_index.get(panel_id)
+        if row is None:
             raise ValueError(f"panel id unknown: {panel_id}")
-        self.colors[panel_id] = _validate_rgb(rgb)
+        j = 3 * row
+        self._rgb[j:j + 3] = bytes(_validate_rgb(rgb))
+        self._dirty = True
 
-    async def set_hex(self, panel_id: int, hex_colour: str) -> None:
+    def set_hex(self, panel_id: int, hex_colour: str) -> None:
         """Set RGB for a single panel using a #RRGGBB string."""
-        await self.set_color(panel_id, _hex_to_rgb(hex_colour))
-
-    async def set_all_colors(self, rgb: RGB) -> None:
+        self.set_color(panel_id, _hex_to_rgb(hex_colour))
+
+    def set_colors(self, colours: Union[Mapping[int, RGB], bytes, bytearray]) -> None:
+        """Set RGB for many panels at once.
+
+        Accepts a {panel_id: (r, g, b)} mapping, or a packed buffer of
+        3 * len(ids) bytes in `ids` order that replaces every panel colour.
+        """
+        if isinstance(colours, (bytes, bytearray)):
+            if len(colours) != len(self._rgb):
+                raise ValueError(f"expected {len(self._rgb)} bytes, got {len(colours)}")
+            self._rgb[:] = colours
+            self._dirty = True
+            return
+        rows = [(int(pid), _validate_rgb(rgb)) for pid, rgb in colours.items()]
+        unknown = {pid for pid, _ in rows} - self._id_index.keys()
+        if unknown:
+            raise ValueError(f"unknown panel ids: {sorted(unknown)}")
+        buf = self._rgb
+        id_index = self._id_index
+        for pid, rgb in rows:
+            j = 3 * id_index[pid]
+            buf[j:j + 3] = bytes(rgb)
+        self._dirty = True
+
+    def set_all_colors(self, rgb: RGB) -> None:
         """Set RGB for all panels."""
-        rgb = _validate_rgb(rgb)
-        for panel_id in self._ids_ordered:
-            self.colors[panel_id] = rgb
+        self._rgb[:] = bytes(_validate_rgb(rgb)) * len(self._ids_ordered)
+        self._dirty = True
+
+    # ---------- Deprecated async aliases ----------
+    # The setters used to be coroutines; these keep `await twin.aset_*(...)`
+    # working for one release. Call the plain set_* methods instead.
+
+    async def aset_color(self, panel_id: int, rgb: RGB) -> None:
+        """Deprecated: awaitable alias of set_color()."""
+        _warn_async_setter("set_color")
+        self.set_color(panel_id, rgb)
+
+    async def aset_hex(self, panel_id: int, hex_colour: str) -> None:
+        """Deprecated: awaitable alias of set_hex()."""
+        _warn_async_setter("set_hex")
+        self.set_hex(panel_id, hex_colour)
+
+    async def aset_all_colors(self, rgb: RGB) -> None:
+        """Deprecated: awaitable alias of set_all_colors()."""
+        _warn_async_setter("set_all_colors")
+        self.set_all_colors(rgb)
 
     # ---------- Rendering ----------
 
+    def mark_dirty(self) -> None:
+        """Forget what the device shows so the next sync() resends every panel.
+
+        Use this when something else (an app, a scene, another client) may
+        have changed the panels since the twin last wrote them.
+        """
+        self._last_sent = None
+        self._dirty = True
+
+    def _subset_ids(self, only: Iterable[int]) -> Tuple[int, ...]:
+        """Resolve an only= selection to IDs in twin order, memoized per subset."""
+        key = frozenset(map(int, only))
+        ids = self._subset_cache.get(key)
+        if ids is None:
+            unknown = key - self._id_index.keys()
+            if unknown:
+                raise ValueError(f"unknown panel ids: {sorted(unknown)}")
+            ids = tuple(pid for pid in self._ids_ordered if pid in key)
+            if len(self._subset_cache) >= _SUBSET_CACHE_SIZE:
+                self._subset_cache.clear()
+            self._subset_cache[key] = ids
+        return ids
+
+    def _frame(self, brightness: Optional[int]) -> bytes:
+        """Snapshot of the packed colours as they will be sent, with brightness applied.
+
+        Always a copy, so edits made while a write is in flight never leak
+        into what sync() records as sent.
+        """
+        frame = bytes(self._rgb)
+        bn = _brightness_factor(brightness)
+        # Scale every channel in one C-level pass rather than per panel.
+        return frame if bn is None else frame.translate(_brightness_table(bn))
+
+    def _changed_ids(self, frame: bytes, last: bytes) -> List[int]:
+        """IDs whose rendered colour differs from the last frame sent."""
+        return [
+            pid
+            for i, pid in enumerate(self._ids_ordered)
+            if frame[3 * i:3 * i + 3] != last[3 * i:3 * i + 3]
+        ]
+
+    def _build_anim_fast(self, ids: Sequence[int], transition: int, rgb: Union[bytes, bytearray]) -> str:
+        """Same output as _build_anim, reusing the cached record prefixes."""
+        if ids is self._ids_ordered:
+            return _format_anim(self._prefixes, rgb, transition)
+        rows = [self._id_index[pid] for pid in ids]
+        cols = b"".join([rgb[3 * i:3 * i + 3] for i in rows])
+        return _format_anim([self._prefixes[i] for i in rows], cols, transition)
+
     async def sync(
         self,
         *,
@@ -280,49 +554,106 @@ class DigitalTwin:
         command: str = "display",
         only: Optional[Iterable[int]] = None,
         brightness: Optional[int] = None,
+        force: bool = False,
     ) -> None:
-        """Apply current colours as a static scene via /effects write."""
-        if command not in ("display", "displayTemp"):
+        """Apply current colours as a static scene via /effects write.
+
+        A full "display" sync only sends panels whose colour changed since
+        the last one, and nothing at all if none did; pass force=True to
+        resend every panel.
+        """
+        template = _PAYLOAD_TEMPLATES.get(command)
+        if template is None:
             raise ValueError('command must be "display" or "displayTemp"')
-
-        if only is None:
-            ids: Iterable[int] = self._ids_ordered
-        else:
-            only_set = set(int(x) for x in only)
-            unknown = only_set - self._ids_set
-            if unknown:
-                raise ValueError(f"unknown panel ids: {sorted(unknown)}")
-            ids = tuple(pid for pid in self._ids_ordered if pid in only_set)
-
-        anim = _build_anim(ids, self.colors, transition_ms, brightness=brightness)
-        payload = {
-            "command": command,
-            "version": "1.0",
-            "animType": "static",
-            "animData": anim,
-            "palette": [],
-            "loop": False,
-        }
-
-        write_effect = getattr(self._nl, "write_effect", None)
-        if callable(write_effect):
-            result = write_effect(payload)
-            if hasattr(result, "__await__"):
-                await result
+        last = self._last_sent
+        full_display = only is None and command == "display"
+        diffable = full_display and not force and last is not None
+        if diffable and not self._dirty and brightness == self._last_brightness:
             return
 
-        for name in ("effects_write", "display_effect"):
-            meth = getattr(self._nl, name, None)
-            if callable(meth):
-                result = meth(payload)
-                if hasattr(result, "__await__"):
-                    await result
+        frame = self._frame(brightness)
+        ids: Sequence[int]
+        if only is not None:
+            ids = self._subset_ids(only)
+        elif diffable and last is not None:
+            if frame == last:
+                self._dirty = False
+                self._last_brightness = brightness
                 return
+            ids = self._changed_ids(frame, last)
+        else:
+            ids = self._ids_ordered
 
-        raise RuntimeError(
-            "Nanoleaf client does not expose a write_effect/effects_write/display_effect method."
+        anim = self._build_anim_fast(ids, transition_ms, frame)
+        payload = {**template, "animData": anim}
+        if full_display:
+            # Cleared before awaiting so an edit made mid-write sets it again.
+            self._dirty = False
+        try:
+            await self._do_write(payload)
+        except BaseException:
+            self._dirty = True
+            raise
+
+        if command != "display":
+            # displayTemp hands the panels back to the previous effect.
+            self._last_sent = None
+        elif only is None:
+            self._last_sent = frame
+            self._last_brightness = brightness
+        elif last is not None:
+            sent = bytearray(last)
+            for pid in ids:
+                j = 3 * self._id_index[pid]
+                sent[j:j + 3] = frame[j:j + 3]
+            if sent != last:
+                # The device no longer matches a full render (e.g. the subset
+                # went out at another brightness): let the next sync() diff.
+                self._dirty = True
+            self._last_sent = bytes(sent)
+
+    async def _do_write(self, payload: Dict[str, Any]) -> None:
+        """Send a payload through the writer resolved in __init__."""
+        result = self._write_effect(payload)
+        if hasattr(result, "__await__"):
+            await result
+
+    def schedule_sync(self, delay_ms: int = 16, **kwargs: Any) -> None:
+        """Debounced sync(): write once after delay_ms without further calls.
+
+        Each call restarts the timer, so a burst of edits collapses into a
+        single write. Keyword arguments are passed to sync() unchanged; the
+        latest call wins. Must be called from within a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._pending_sync is not None:
+            self._pending_sync.cancel()
+        self._pending_sync = loop.call_later(
+            max(0, int(delay_ms)) / 1000.0, self._start_scheduled_sync, kwargs
         )
 
+    def _start_scheduled_sync(self, kwargs: Dict[str, Any]) -> None:
+        """Timer callback: run the coalesced sync() as a task."""
+        self._pending_sync = None
+        task = asyncio.ensure_future(self._run_scheduled_sync(kwargs))
+        self._sync_tasks.add(task)
+        task.add_done_callback(self._sync_tasks.discard)
+
+    async def _run_scheduled_sync(self, kwargs: Dict[str, Any]) -> None:
+        """Run one scheduled sync(), never overlapping a previous one."""
+        if self._sync_lock is None:
+            self._sync_lock = asyncio.Lock()
+        async with self._sync_lock:
+            try:
+                await self.sync(**kwargs)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Scheduled sync failed")
+
+    @cached_property
+    def _effects(self) -> EffectsClient:
+        """EffectsClient bound to this twin's client, built on first use."""
+        return EffectsClient(self._nl)
+
     async def apply_temp(
         self,
         *,
@@ -332,10 +663,12 @@ class DigitalTwin:
         brightness: Optional[int] = None,
     ) -> None:
         """Blink: temporarily apply the twin colours, then restore previous effect."""
-        ef = EffectsClient(self._nl)
+        ef = self._effects
 
         prev: Optional[str] = None
-        # Best-effort read of selected effect; ignore failures without a broad-except block.
+        # Read the selected effect before the displayTemp write goes out:
+        # once the device applies it, /effects/select reports the temp scene.
+        # Best-effort read; ignore failures without a broad-except block.
         with suppress(Exception):
             prev = await ef.get_selected_effect()
 
@@ -6,42 +6,230 @@ Nanoleaf client for HTTP via ``_get_json`` and ``_put_json`` methods.
 
 from __future__ import annotations
 
-from typing import Any, Mapping, Sequence
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ._json import dumps, loads
+
+# Queued buffered write: the payload and the future its caller awaits.
+_QueuedWrite = Tuple[Dict[str, Any], "asyncio.Future[None]"]
+
+
+def _static_frames(anim_data: str) -> Optional[Dict[str, List[str]]]:
+    """Split static animData into {panel id: its tokens}; None if malformed."""
+    tokens = anim_data.split()
+    try:
+        count = int(tokens[0])
+        frames: Dict[str, List[str]] = {}
+        i = 1
+        for _ in range(count):
+            end = i + 2 + 5 * int(tokens[i + 1])
+            if end > len(tokens):
+                return None
+            frames[tokens[i]] = tokens[i:end]
+            i = end
+    except (IndexError, ValueError):
+        return None
+    return frames if i == len(tokens) else None
+
+
+def _merge_writes(writes: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], int]]:
+    """Coalesce consecutive static writes; return (payload, writes merged).
+
+    Two static writes merge when every key but animData matches; panels in
+    the later write replace the same panels in the earlier one.
+    """
+    def settings(write: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in write.items() if k != "animData"}
+
+    merged: List[Tuple[Dict[str, Any], int]] = []
+    frames: Optional[Dict[str, List[str]]] = None
+    for write in writes:
+        new = None
+        if write.get("animType") == "static":
+            new = _static_frames(str(write.get("animData", "")))
+        if merged and frames is not None and new is not None:
+            last, n = merged[-1]
+            if settings(last) == settings(write):
+                frames.update(new)
+                anim = " ".join([str(len(frames))] + [t for f in frames.values() for t in f])
+                merged[-1] = ({**last, "animData": anim}, n + 1)
+                continue
+        merged.append((write, 1))
+        frames = new
+    return merged
 
 
 class EffectsClient:
-    """Spec-aligned helpers for Effects list/select/write."""
+    """Spec-aligned helpers for Effects list/select/write.
+
+    Reads are cached briefly (effect list for 30 s, selection for 2 s) so
+    polling callers do not hit the device every time; select/write through
+    this client drops the cache immediately.
+    """
+
+    _EFFECTS_TTL = 30.0
+    _SELECTED_TTL = 2.0
 
     def __init__(self, nl: Any) -> None:
         """Bind to a Nanoleaf-like client that exposes _get_json/_put_json."""
+        session = getattr(nl, "_session", None)
+        if getattr(session, "closed", False):
+            raise RuntimeError("Nanoleaf client's HTTP session is closed; reuse one open session")
         self._nl = nl
+        # (time.monotonic() when fetched, value)
+        self._effects_cache: Optional[Tuple[float, list[str]]] = None
+        self._selected_cache: Optional[Tuple[float, str]] = None
+        # Set while buffered() is active; None means write straight through.
+        self._write_queue: Optional["asyncio.Queue[Optional[_QueuedWrite]]"] = None
+
+    def invalidate(self) -> None:
+        """Forget cached reads, e.g. after changing effects via another client."""
+        self._effects_cache = None
+        self._selected_cache = None
 
     async def get_effects_list(self) -> list[str]:
         """Return the list of available effect names."""
+        cached = self._effects_cache
+        if cached is not None and time.monotonic() - cached[0] < self._EFFECTS_TTL:
+            return list(cached[1])
         # pylint: disable=protected-access
         data = await self._nl._get_json("/effects/effectsList")  # type: ignore[attr-defined]
-        return [str(x) for x in data] if isinstance(data, Sequence) else []
+        effects: list[str] = []
+        if isinstance(data, list):
+            # Decoded JSON string arrays need no per-item pass; only coerce
+            # when the first entry shows the device sent something else.
+            effects = data if not data or isinstance(data[0], str) else [str(x) for x in data]
+        self._effects_cache = (time.monotonic(), effects)
+        return list(effects)
 
     async def get_selected_effect(self) -> str:
         """Return the currently selected effect name."""
+        cached = self._selected_cache
+        if cached is not None and time.monotonic() - cached[0] < self._SELECTED_TTL:
+            return cached[1]
         # pylint: disable=protected-access
         data = await self._nl._get_json("/effects/select")  # type: ignore[attr-defined]
+        selected = ""
         if isinstance(data, str):
-            return data
-        if isinstance(data, dict) and isinstance(data.get("select"), str):
-            return str(data["select"])
-        return ""
+            selected = data
+        elif isinstance(data, dict) and isinstance(data.get("select"), str):
+            selected = str(data["select"])
+        self._selected_cache = (time.monotonic(), selected)
+        return selected
+
+    async def snapshot(self) -> Tuple[list[str], str]:
+        """Return (effects list, selected effect), fetched concurrently."""
+        effects, selected = await asyncio.gather(
+            self.get_effects_list(), self.get_selected_effect()
+        )
+        return effects, selected
 
     async def select_effect(self, name: str) -> None:
         """Select an existing effect by name."""
+        self.invalidate()
         # pylint: disable=protected-access
         await self._nl._put_json("/effects", {"select": str(name)})  # type: ignore[attr-defined]
 
     async def write_effect(self, write_dict: Mapping[str, object]) -> None:
         """PUT /effects with a {'write': {...}} payload (no validation)."""
+        self.invalidate()
+        queue = self._write_queue
+        if queue is not None:
+            fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            queue.put_nowait((dict(write_dict), fut))
+            await fut
+            return
+        await self._put_write(dict(write_dict))
+
+    async def write_raw(self, payload: bytes) -> None:
+        """PUT /effects with an already-encoded {"write": {...}} JSON body.
+
+        Meant for streaming callers pairing it with build_write_payload();
+        bypasses buffered(). Clients without _put_raw get the body decoded
+        and sent through _put_json.
+        """
+        self.invalidate()
+        # pylint: disable=protected-access
+        put_raw = getattr(self._nl, "_put_raw", None)
+        if put_raw is not None:
+            await put_raw("/effects", payload)
+        else:
+            await self._nl._put_json("/effects", loads(payload))  # type: ignore[attr-defined]
+
+    @staticmethod
+    def build_write_payload(command: str, anim_type: str, **extra: Any) -> Callable[[str], bytes]:
+        """Return a function encoding a write body that differs only in animData.
+
+        Everything but animData is encoded once, up front; the returned
+        function only encodes the animData string and joins the pieces.
+        """
+        settings = dumps({"command": command, "animType": anim_type, **extra})
+        prefix = b'{"write":' + settings[:-1] + b',"animData":'
+        suffix = b"}}"
+
+        def build(anim_data: str) -> bytes:
+            return prefix + dumps(anim_data) + suffix
+
+        return build
+
+    async def _put_write(self, write: Dict[str, Any]) -> None:
         # pylint: disable=protected-access
-        body = {"write": dict(write_dict)}
-        await self._nl._put_json("/effects", body)  # type: ignore[attr-defined]
+        await self._nl._put_json("/effects", {"write": write})  # type: ignore[attr-defined]
+
+    @asynccontextmanager
+    async def buffered(self, window_ms: int = 20) -> AsyncIterator["EffectsClient"]:
+        """Coalesce write_effect() calls made within window_ms of each other.
+
+        Consecutive static writes with the same settings are merged into one
+        PUT (later panels win); anything else is sent in order. Each
+        write_effect() call still returns only once its PUT has completed.
+        """
+        if self._write_queue is not None:
+            raise RuntimeError("buffered() is already active")
+        queue: asyncio.Queue[Optional[_QueuedWrite]] = asyncio.Queue()
+        self._write_queue = queue
+        drainer = asyncio.ensure_future(self._drain_writes(queue, max(0, int(window_ms)) / 1000.0))
+        try:
+            yield self
+        finally:
+            self._write_queue = None
+            queue.put_nowait(None)
+            await drainer
+
+    async def _drain_writes(
+        self, queue: "asyncio.Queue[Optional[_QueuedWrite]]", window: float
+    ) -> None:
+        """Background task for buffered(): flush queued writes per window."""
+        done = False
+        while not done:
+            item = await queue.get()
+            if item is None:
+                break
+            await asyncio.sleep(window)
+            batch = [item]
+            while not queue.empty():
+                nxt = queue.get_nowait()
+                if nxt is None:
+                    done = True
+                    break
+                batch.append(nxt)
+
+            futures = iter([fut for _, fut in batch])
+            for payload, count in _merge_writes([write for write, _ in batch]):
+                waiters = [next(futures) for _ in range(count)]
+                try:
+                    await self._put_write(payload)
+                except Exception as exc:  # pylint: disable=broad-except
+                    for fut in waiters:
+                        if not fut.done():
+                            fut.set_exception(exc)
+                else:
+                    for fut in waiters:
+                        if not fut.done():
+                            fut.set_result(None)
 
     # Convenience aliases (optional)
     async def write_custom_effect(  # pylint: disable=too-many-arguments
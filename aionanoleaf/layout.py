@@ -2,116 +2,127 @@
 """Layout helpers: panel orientation and positions.
 
 Exposes spec-aligned endpoints around /panelLayout.
-- Panel(...) accepts either (panelId, x, y) or a single "position" object/dict.
+- Panel(panelId, x, y), plus Panel.from_mapping()/Panel.from_obj() for device data.
 - get_positions(): list of {panelId, x, y} dicts
+- get_positions_tuples(): list of (panelId, x, y) tuples
+- get_positions_arrays(): parallel int arrays {ids, x, y}
 - get_global_orientation(): int (0..360) if available
 - set_global_orientation(angle): PUT {"value": angle}
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Mapping, Optional, overload
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 
 
 def _to_int(v: Any) -> Optional[int]:
     """Best-effort int conversion with Optional[Any] input."""
-    if isinstance(v, bool):  # bool is int subclass; keep explicit
-        return int(v)
-    if isinstance(v, int):
+    # JSON positionData is almost always plain ints: check the exact type
+    # first, before any isinstance() walk.
+    # pylint: disable=unidiomatic-typecheck
+    vt = type(v)
+    if vt is int:
         return v
-    if isinstance(v, str):
+    if vt is str:
         try:
             return int(v)
         except ValueError:
             return None
+    if isinstance(v, int):  # bool and other int subclasses
+        return int(v)
     return None
 
 
+def _position_rows(pos: Any) -> Iterator[Tuple[int, int, int]]:
+    """Yield (panelId, x, y) for each well-formed positionData entry."""
+    if not isinstance(pos, list):
+        return
+    for p in pos:
+        if not isinstance(p, dict):
+            continue
+        pid = _to_int(p.get("panelId"))
+        x = _to_int(p.get("x"))
+        y = _to_int(p.get("y"))
+        if pid is not None and x is not None and y is not None:
+            yield pid, x, y
+
+
+@dataclass(frozen=True)
 class Panel:
     """Runtime panel object with IDs and coordinates.
 
-    Accepts either:
-      - Panel(panelId: int, x: int, y: int)
-      - Panel(pos: Mapping[str, Any])  # keys: panelId/x/y or id/x_coordinate/y_coordinate
-      - Panel(pos: Any)  # object with attributes panelId/x/y or id/x_coordinate/y_coordinate
+    Construct with Panel(panelId, x, y), or from device data with:
+      - Panel.from_mapping(pos)  # keys: panelId/x/y or id/x_coordinate/y_coordinate
+      - Panel.from_obj(pos)  # attributes panelId/x/y or id/x_coordinate/y_coordinate
+      - Panel.from_any(pos)  # either of the above
 
-    Also exposes `.id` as an alias to `.panelId`.
+    Panels are immutable and compare/hash by (panelId, x, y), so they can
+    be deduplicated in sets. Also exposes `.id` as an alias to `.panelId`.
     """
 
+    __slots__ = ("panelId", "x", "y")  # no per-instance __dict__
+
     panelId: int
     x: int
     y: int
 
-    @overload
-    def __init__(self, panelId: int, x: int, y: int) -> None: ...
-    @overload
-    def __init__(self, pos: Mapping[str, Any]) -> None: ...
-    @overload
-    def __init__(self, pos: Any) -> None: ...
-
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        if len(args) == 1 and not kwargs:
-            pos = args[0]
-            # Mapping case
-            if isinstance(pos, Mapping):
-                pid = _to_int(pos.get("panelId"))
-                if pid is None:
-                    pid = _to_int(pos.get("id"))
-                x = _to_int(pos.get("x"))
-                if x is None:
-                    x = _to_int(pos.get("x_coordinate"))
-                y = _to_int(pos.get("y"))
-                if y is None:
-                    y = _to_int(pos.get("y_coordinate"))
-            else:
-                # Generic object with attributes
-                pid_attr = getattr(pos, "panelId", None)
-                if pid_attr is None:
-                    pid_attr = getattr(pos, "id", None)
-                x_attr = getattr(pos, "x", None)
-                if x_attr is None:
-                    x_attr = getattr(pos, "x_coordinate", None)
-                y_attr = getattr(pos, "y", None)
-                if y_attr is None:
-                    y_attr = getattr(pos, "y_coordinate", None)
-                pid = _to_int(pid_attr)
-                x = _to_int(x_attr)
-                y = _to_int(y_attr)
-
-            if pid is None or x is None or y is None:
-                raise TypeError("Panel(pos): could not extract panelId/x/y")
-            self.panelId = pid
-            self.x = x
-            self.y = y
-            return
-
-        # Tuple/positional/keyword case
-        if len(args) + len(kwargs) == 3:
-            # Support both positional and keyword usage
-            if args:
-                try:
-                    panel_id, x_val, y_val = args  # type: ignore[misc]
-                except Exception as exc:
-                    raise TypeError("Panel(panelId, x, y) requires three ints") from exc
-            else:
-                try:
-                    panel_id = kwargs["panelId"]
-                    x_val = kwargs["x"]
-                    y_val = kwargs["y"]
-                except KeyError as exc:
-                    raise TypeError("Panel(panelId, x, y) missing keyword") from exc
-
-            pid = _to_int(panel_id)
-            x = _to_int(x_val)
-            y = _to_int(y_val)
-            if pid is None or x is None or y is None:
-                raise TypeError("Panel(panelId, x, y) must be integers")
-            self.panelId = pid
-            self.x = x
-            self.y = y
-            return
-
-        raise TypeError("Panel expects (panelId, x, y) or a single position object/dict")
+    def __post_init__(self) -> None:
+        pid = _to_int(self.panelId)
+        x = _to_int(self.x)
+        y = _to_int(self.y)
+        if pid is None or x is None or y is None:
+            raise TypeError("Panel(panelId, x, y) must be integers")
+        # frozen: normalise through object.__setattr__
+        object.__setattr__(self, "panelId", pid)
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+
+    @classmethod
+    def from_any(cls, pos: Any) -> "Panel":
+        """Build from a positionData mapping or an object with the same fields."""
+        if isinstance(pos, Mapping):
+            return cls.from_mapping(pos)
+        return cls.from_obj(pos)
+
+    @classmethod
+    def from_mapping(cls, pos: Mapping[str, Any]) -> "Panel":
+        """Build from a positionData entry (or the id/x_coordinate spelling)."""
+        # Raw values; __post_init__ converts and validates them.
+        pid: Any = pos.get("panelId")
+        if pid is None:
+            pid = pos.get("id")
+        x: Any = pos.get("x")
+        if x is None:
+            x = pos.get("x_coordinate")
+        y: Any = pos.get("y")
+        if y is None:
+            y = pos.get("y_coordinate")
+        return cls(pid, x, y)
+
+    @classmethod
+    def from_obj(cls, pos: Any) -> "Panel":
+        """Build from an object with panelId/x/y (or id/x_coordinate/y_coordinate)."""
+        pid: Any = getattr(pos, "panelId", None)
+        if pid is None:
+            pid = getattr(pos, "id", None)
+        x: Any = getattr(pos, "x", None)
+        if x is None:
+            x = getattr(pos, "x_coordinate", None)
+        y: Any = getattr(pos, "y", None)
+        if y is None:
+            y = getattr(pos, "y_coordinate", None)
+        return cls(pid, x, y)
+
+    # Frozen slots break the default copy/pickle state restore (it goes
+    # through __setattr__), so restore the fields directly.
+    def __getstate__(self) -> Tuple[int, int, int]:
+        return self.panelId, self.x, self.y
+
+    def __setstate__(self, state: Tuple[int, int, int]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
     @property
     def id(self) -> int:  # compatibility with callers that expect `.id`
@@ -123,20 +134,48 @@ class LayoutClient:
 
     def __init__(self, nl: Any) -> None:
         self._nl = nl
+        # Bind the transport once, so a client lacking it fails here rather
+        # than on the first request.
+        try:
+            self._get_json: Any = getattr(nl, "_get_json")
+            self._put_json: Any = getattr(nl, "_put_json")
+        except AttributeError as exc:
+            raise TypeError("LayoutClient needs a client exposing _get_json/_put_json") from exc
 
     async def get_positions(self) -> List[Dict[str, int]]:
         """Return panelLayout.layout.positionData as normalized ints, else [].
 
         Output shape: [{"panelId": int, "x": int, "y": int}, ...]
         """
-        data = None
-        get_layout = getattr(self._nl, "_get_json", None)
-        if callable(get_layout):
-            try:
-                # pylint: disable=protected-access
-                data = await self._nl._get_json("/panelLayout/layout")  # type: ignore[attr-defined]
-            except Exception:
-                data = None
+        return [
+            {"panelId": pid, "x": x, "y": y}
+            for pid, x, y in _position_rows(await self._position_data())
+        ]
+
+    async def get_positions_tuples(self) -> List[Tuple[int, int, int]]:
+        """Return positions as (panelId, x, y) tuples, in device order."""
+        return list(_position_rows(await self._position_data()))
+
+    async def get_positions_arrays(self) -> Dict[str, array[int]]:
+        """Return positions as parallel int arrays, in device order.
+
+        Output shape: {"ids": array('i'), "x": array('i'), "y": array('i')}
+        """
+        ids: array[int] = array("i")
+        xs: array[int] = array("i")
+        ys: array[int] = array("i")
+        for pid, x, y in _position_rows(await self._position_data()):
+            ids.append(pid)
+            xs.append(x)
+            ys.append(y)
+        return {"ids": ids, "x": xs, "y": ys}
+
+    async def _position_data(self) -> Any:
+        """Fetch the raw positionData list (None when unavailable)."""
+        try:
+            data = await self._get_json("/panelLayout/layout")
+        except Exception:
+            data = None
 
         pos = None
         if isinstance(data, dict):
@@ -151,22 +190,11 @@ class LayoutClient:
                 except Exception:
                     pos = None
 
-        out: List[Dict[str, int]] = []
-        if isinstance(pos, list):
-            for p in pos:
-                if not isinstance(p, dict):
-                    continue
-                pid = _to_int(p.get("panelId"))
-                x = _to_int(p.get("x"))
-                y = _to_int(p.get("y"))
-                if pid is not None and x is not None and y is not None:
-                    out.append({"panelId": pid, "x": x, "y": y})
-        return out
+        return pos
 
     async def get_global_orientation(self) -> Optional[int]:
         """GET /panelLayout/globalOrientation -> int or dict{'value': int}."""
-        # pylint: disable=protected-access
-        data = await self._nl._get_json("/panelLayout/globalOrientation")  # type: ignore[attr-defined]
+        data = await self._get_json("/panelLayout/globalOrientation")
         if isinstance(data, int):
             return data
         if isinstance(data, dict):
@@ -181,5 +209,4 @@ class LayoutClient:
         if a < 0 or a > 360:
             a = max(0, min(360, a))
         payload: Dict[str, int] = {"value": a}
-        # pylint: disable=protected-access
-        await self._nl._put_json("/panelLayout/globalOrientation", payload)  # type: ignore[attr-defined]
+        await self._put_json("/panelLayout/globalOrientation", payload)
@@ -23,7 +23,7 @@ import asyncio
 import json
 import logging
 import socket
-from typing import Any, Callable, Optional
+from typing import Any, Callable
 
 from aiohttp import (
     ClientConnectorError,
@@ -32,7 +32,10 @@ from aiohttp import (
     ClientSession,
     ClientTimeout,
     ClientConnectionError,
+    DummyCookieJar,
+    TCPConnector,
 )
+from yarl import URL
 
 from .events import (
     EffectsEvent,
@@ -50,84 +53,11 @@ from .exceptions import (
     Unauthorized,
     Unavailable,
 )
+from ._json import dumps, loads
 from .layout import Panel
 from .typing import InfoData
 
-_LOGGER = logging.getLogger(__name__)
-
-class Nanoleaf:  # existing class
-    async def authorize(self) -> Optional[str]:
-        """Obtain a token while device is in link mode.
-
-        Tries POST /api/v1/new (classic) then GET /api/v1/new (newer fw).
-        Logs status + short body preview at DEBUG and accepts multiple JSON shapes.
-        """
-        url = f"{self._base}/new"
-
-        def _extract_token(obj: Any) -> Optional[str]:
-            if isinstance(obj, dict):
-                for k in ("auth_token", "authToken", "token"):
-                    v = obj.get(k)
-                    if isinstance(v, str):
-                        return v
-                succ = obj.get("success")
-                if isinstance(succ, dict):
-                    for k in ("auth_token", "authToken", "token"):
-                        v = succ.get(k)
-                        if isinstance(v, str):
-                            return v
-            elif isinstance(obj, list):
-                for item in obj:
-                    tok = _extract_token(item)
-                    if tok:
-                        return tok
-            return None
-
-        async def _try_post() -> Optional[str]:
-            import aiohttp
-            try:
-                payload = {"client_name": "homeassistant", "client_version": "1.0"}
-                async with self._session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    text = await resp.text()
-                    _LOGGER.debug("authorize(POST): %s -> %s; body=%s", url, resp.status, text[:256])
-                    if resp.status == 200:
-                        try:
-                            data = json.loads(text)
-                        except Exception:
-                            data = None
-                        tok = _extract_token(data)
-                        if tok:
-                            self._token = tok
-                            return tok
-                    if resp.status in (401, 403):
-                        raise RuntimeError("Pairing not enabled (hold power 5–7s).")
-            except Exception as exc:
-                _LOGGER.debug("authorize(POST): exception: %s", exc)
-            return None
-
-        async def _try_get() -> Optional[str]:
-            import aiohttp
-            async with self._session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                text = await resp.text()
-                _LOGGER.debug("authorize(GET):  %s -> %s; body=%s", url, resp.status, text[:256])
-                if resp.status == 200:
-                    try:
-                        data = json.loads(text)
-                    except Exception:
-                        data = None
-                    tok = _extract_token(data)
-                    if tok:
-                        self._token = tok
-                        return tok
-                if resp.status in (401, 403):
-                    raise RuntimeError("Pairing not enabled (hold power 5–7s).")
-                raise RuntimeError(f"Authorization failed: {resp.status} {text[:256]}")
-
-        token = await _try_post()
-        if token:
-            return token
-        return await _try_get()
-
+__all__ = ["Nanoleaf", "build_session"]
 
 
 def _format_host_for_url(host: str) -> str:
@@ -150,6 +80,22 @@ def _format_host_for_url(host: str) -> str:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared by every request: bodies are pre-encoded bytes, so label them
+# explicitly, and ask for JSON back.
+_JSON_HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
+
+
+def build_session(limit_per_host: int = 4, keepalive_timeout: float = 75) -> ClientSession:
+    """Return a ClientSession suited to talking to Nanoleaf devices.
+
+    Create one per application and share it between every Nanoleaf client
+    and helper so requests reuse kept-alive connections. Must be called
+    from a running event loop.
+    """
+    connector = TCPConnector(limit_per_host=limit_per_host, keepalive_timeout=keepalive_timeout)
+    # Nanoleaf devices never set cookies; skip cookie handling entirely.
+    return ClientSession(connector=connector, cookie_jar=DummyCookieJar())
+
 
 class Nanoleaf:
     """Nanoleaf device."""
@@ -169,6 +115,9 @@ class Nanoleaf:
         self._host = host
         self._auth_token = auth_token
         self._port = port
+        # Parsed request URLs by path, valid for the token in _urls_token.
+        self._urls: dict[str, URL] = {}
+        self._urls_token: str | None = None
         # honour the retries argument rather than always forcing three attempts
         self._retries = retries
 
@@ -315,18 +264,56 @@ class Nanoleaf:
     def _api_url(self) -> str:
         return f"http://{self.host}:{self.port}/api/v1"
 
+    def _url(self, path: str) -> URL:
+        """Return the parsed request URL for path, built once per auth token."""
+        token = self.auth_token
+        if token != self._urls_token:
+            self._urls.clear()
+            self._urls_token = token
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = URL(f"{self._api_url}/{token}/{path}")
+        return url
+
     async def _request(
         self, method: str, path: str, data: dict | None = None
     ) -> ClientResponse:
         """Make an authorized request to Nanoleaf with an auth_token."""
-        url = f"{self._api_url}/{self.auth_token}/{path}"
-        json_data = json.dumps(data)
+        return await self._request_raw(method, path, dumps(data))
+
+    async def _get_json(self, path: str) -> Any:
+        """GET a path below the API root, e.g. "/effects/select", as JSON."""
+        resp = await self._request("get", path.lstrip("/"))
+        # Read the body once as bytes and decode it here.
+        raw = await resp.read()
+        return loads(raw) if raw else None
+
+    async def _put_json(self, path: str, body: Any) -> None:
+        """PUT a JSON body to a path below the API root."""
+        resp = await self._request("put", path.lstrip("/"), body)
+        # Errors were raised by _request; success bodies are empty or unused.
+        resp.release()
+
+    async def _put_raw(self, path: str, body: bytes) -> None:
+        """PUT an already-encoded JSON body, e.g. a prebuilt effect write."""
+        resp = await self._request_raw("put", path.lstrip("/"), body)
+        resp.release()
+
+    async def _request_raw(
+        self, method: str, path: str, json_data: bytes
+    ) -> ClientResponse:
+        """Send an encoded body with retries; map failures to our exceptions."""
+        url = self._url(path)
         err = None
         # try self._retries times and only then raise an exception if we failed
         for attempt in range(self._retries):
             try:
                 resp = await self._session.request(
-                    method, url, data=json_data, timeout=self._REQUEST_TIMEOUT
+                    method,
+                    url,
+                    data=json_data,
+                    headers=_JSON_HEADERS,
+                    timeout=self._REQUEST_TIMEOUT,
                 )
                 # it worked (or 401, but that's a hard fail), so clear any
                 # previous error
@@ -402,7 +389,7 @@ class Nanoleaf:
         self._color_mode = data["state"]["colorMode"]
         self._effects_list = data["effects"]["effectsList"]
         self._effect = data["effects"]["select"]
-        self._panels = {Panel(panel) for panel in data["panelLayout"]["layout"]["positionData"]}
+        self._panels = {Panel.from_mapping(panel) for panel in data["panelLayout"]["layout"]["positionData"]}
 
     async def set_state(
         self,
@@ -6,62 +6,102 @@ GET /rhythm returns a dict containing fields like:
 Some devices support setting rhythmMode via PUT /rhythm { "rhythmMode": <int> }.
 
 This client exposes a safe superset: it reads the dict as-is and provides
-helpers for common keys. set_mode() accepts int or 'microphone'/'aux'.
+helpers for common keys. set_mode() accepts int or 'microphone'/'aux';
+set_mode_int()/set_mode_name() skip the type dispatch.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Union
+import time
+from typing import Any, Dict, Optional, Tuple, Union
 
 
+# Includes common capitalisations so they resolve without strip()/lower().
 _MODE_MAP = {
-    "microphone": 0,
-    "mic": 0,
-    "aux": 1,
+    spelling: value
+    for name, value in (("microphone", 0), ("mic", 0), ("aux", 1))
+    for spelling in (name, name.upper(), name.capitalize())
 }
 
 
+def _parse_bool(val: object) -> bool:
+    """Interpret a /rhythm flag that may arrive as bool, int or string."""
+    if isinstance(val, bool):
+        return val
+    if isinstance(val, int):
+        return bool(val)
+    if isinstance(val, str):
+        return val.lower() in ("1", "true", "yes", "on")
+    return False
+
+
+def _parse_int(val: object) -> Optional[int]:
+    """Interpret a /rhythm number that may arrive as int or string."""
+    if isinstance(val, bool):  # bool is a subclass of int, but be explicit
+        return int(val)
+    if isinstance(val, int):
+        return val
+    if isinstance(val, str):
+        try:
+            return int(val)
+        except ValueError:
+            return None
+    return None
+
+
 class RhythmClient:
-    """Thin wrapper over a Nanoleaf-like client with _get_json/_put_json."""
+    """Thin wrapper over a Nanoleaf-like client with _get_json/_put_json.
+
+    /rhythm is cached for half a second so reading several fields in a row
+    costs one request; set_mode() drops the cache.
+    """
+
+    _INFO_TTL = 0.5
 
     def __init__(self, nl: Any) -> None:
         self._nl = nl
+        # Bind the transport once; both are required, so fail here rather
+        # than on the first request.
+        try:
+            self._get_json: Any = getattr(nl, "_get_json")
+            self._put_json: Any = getattr(nl, "_put_json")
+        except AttributeError as exc:
+            raise TypeError("RhythmClient needs a client exposing _get_json/_put_json") from exc
+        # (time.monotonic() when fetched, /rhythm dict)
+        self._info_cache: Optional[Tuple[float, Dict[str, object]]] = None
 
     async def get_info(self) -> Dict[str, object]:
         """Return raw /rhythm dict; {} on failure."""
-        # pylint: disable=protected-access
+        cached = self._info_cache
+        if cached is not None and time.monotonic() - cached[0] < self._INFO_TTL:
+            return dict(cached[1])
         try:
-            data = await self._nl._get_json("/rhythm")  # type: ignore[attr-defined]
+            data = await self._get_json("/rhythm")
         except Exception:
             return {}
-        return data if isinstance(data, dict) else {}
+        if not isinstance(data, dict):
+            return {}
+        self._info_cache = (time.monotonic(), data)
+        return dict(data)
+
+    async def snapshot(self) -> Tuple[bool, Optional[int], Optional[int]]:
+        """Return (rhythmActive, rhythmMode, rhythmPos) from a single fetch."""
+        info = await self.get_info()
+        return (
+            _parse_bool(info.get("rhythmActive")),
+            _parse_int(info.get("rhythmMode")),
+            _parse_int(info.get("rhythmPos")),
+        )
 
     async def is_active(self) -> bool:
         """Return /rhythm.rhythmActive if present."""
         info = await self.get_info()
-        val = info.get("rhythmActive")
-        if isinstance(val, bool):
-            return val
-        if isinstance(val, int):
-            return bool(val)
-        if isinstance(val, str):
-            return val.lower() in ("1", "true", "yes", "on")
-        return False
+        return _parse_bool(info.get("rhythmActive"))
 
     async def get_mode(self) -> Optional[int]:
         """Return /rhythm.rhythmMode as int if present."""
         info = await self.get_info()
-        val = info.get("rhythmMode")
-        if isinstance(val, bool):  # bool is a subclass of int, but be explicit
-            return int(val)
-        if isinstance(val, int):
-            return val
-        if isinstance(val, str):
-            try:
-                return int(val)
-            except ValueError:
-                return None
-        return None
+        return _parse_int(info.get("rhythmMode"))
 
     async def set_mode(self, mode: Union[int, str]) -> None:
         """PUT /rhythm with {'rhythmMode': <int>}.
@@ -69,14 +109,28 @@ class RhythmClient:
         Accepts: 0/1 or 'microphone'/'mic'/'aux'.
         """
         if isinstance(mode, str):
+            await self.set_mode_name(mode)
+        else:
+            await self.set_mode_int(mode)
+
+    async def set_mode_int(self, mode: int) -> None:
+        """PUT /rhythm with rhythmMode 0 (microphone) or 1 (aux)."""
+        mode_int = int(mode)
+        if mode_int not in (0, 1):
+            raise ValueError("mode must be 0 or 1")
+        await self._put_mode(mode_int)
+
+    async def set_mode_name(self, mode: str) -> None:
+        """PUT /rhythm with rhythmMode given as 'microphone'/'mic'/'aux'."""
+        # Exact spellings hit the map directly; normalise only on a miss.
+        m = _MODE_MAP.get(mode)
+        if m is None:
             m = _MODE_MAP.get(mode.strip().lower())
             if m is None:
                 raise ValueError("mode must be 0/1 or 'microphone'/'mic'/'aux'")
-            mode_int = m
-        else:
-            mode_int = int(mode)
-            if mode_int not in (0, 1):
-                raise ValueError("mode must be 0 or 1")
+        await self._put_mode(m)
+
+    async def _put_mode(self, mode_int: int) -> None:
         payload: Dict[str, int] = {"rhythmMode": mode_int}
-        # pylint: disable=protected-access
-        await self._nl._put_json("/rhythm", payload)  # type: ignore[attr-defined]
+        self._info_cache = None
+        await self._put_json("/rhythm", payload)
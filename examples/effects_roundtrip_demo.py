@@ -1,12 +1,7 @@
 """List effects, select one, push a trivial static scene write."""
 
-try:
-    from aiohttp import ClientSession  # type: ignore
-except Exception:  # pragma: no cover
-    ClientSession = object  # type: ignore
-
 from asyncio import run
-from aionanoleaf import Nanoleaf
+from aionanoleaf import Nanoleaf, build_session
 from aionanoleaf.effects import EffectsClient
 
 HOST = "192.168.0.50"  # set me
@@ -14,12 +9,12 @@ HOST = "192.168.0.50"  # set me
 
 async def main():
     """Run the demo."""
-    async with ClientSession() as session:  # type: ignore[operator]
+    async with build_session() as session:
         nl = Nanoleaf(session, HOST)  # type: ignore[call-arg]
         ef = EffectsClient(nl)
 
-        effects = await ef.get_effects_list()
-        current = await ef.get_selected_effect()
+        # Both GETs are independent, so snapshot() runs them concurrently.
+        effects, current = await ef.snapshot()
         print("Available:", effects)
         print("Selected :", current)
 
@@ -6,7 +6,7 @@ except Exception:  # pragma: no cover
 
 from asyncio import run
 from typing import Any, Dict
-from aionanoleaf import Nanoleaf
+from aionanoleaf import Nanoleaf, build_session
 from aionanoleaf.layout import LayoutClient
 
 HOST = "192.168.0.50"  # or IPv6 literal like "fe80::1"
@@ -24,7 +24,7 @@ async def make_client(session: ClientSession) -> Nanoleaf:
 
 
 async def main() -> None:
-    async with ClientSession() as session:  # type: ignore[operator]
+    async with build_session() as session:
         nl = await make_client(session)
         layout = LayoutClient(nl)
 
@@ -6,7 +6,7 @@ except Exception:  # pragma: no cover
 
 from asyncio import run
 from typing import Any, Dict
-from aionanoleaf import Nanoleaf
+from aionanoleaf import Nanoleaf, build_session
 from aionanoleaf.rhythm import RhythmClient
 
 HOST = "192.168.0.50"
@@ -24,17 +24,19 @@ async def make_client(session: ClientSession) -> Nanoleaf:
 
 
 async def main() -> None:
-    async with ClientSession() as session:  # type: ignore[operator]
+    async with build_session() as session:
         nl = await make_client(session)
         rh = RhythmClient(nl)
 
         info = await rh.get_info()
         print("Rhythm info:", info)
-        print("Active:", await rh.is_active())
-        print("Mode:", await rh.get_mode())
+        # One /rhythm read for all three fields
+        active, mode, pos = await rh.snapshot()
+        print("Active:", active)
+        print("Mode:", mode)
+        print("Position:", pos)
 
         # Toggle mode if possible (0 <-> 1)
-        mode = await rh.get_mode()
         if mode in (0, 1):
             await rh.set_mode(1 - mode)
             print("Toggled mode ->", await rh.get_mode())
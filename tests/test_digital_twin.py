@@ -2,12 +2,22 @@
 
 # pylint: disable=missing-class-docstring,too-few-public-methods,duplicate-code
 
+import asyncio
+import json
+
 try:
     import pytest  # type: ignore
 except ImportError:  # pragma: no cover
     pytest = None  # type: ignore
 
-from aionanoleaf.digital_twin import DigitalTwin, _build_anim
+from aionanoleaf.digital_twin import (
+    DigitalTwin,
+    _apply_brightness,
+    _brightness_table,
+    _build_anim,
+    _hex_to_rgb,
+    _validate_rgb,
+)
 
 
 class DummyPanel:
@@ -33,6 +43,20 @@ class DummyLight:
         self.writes.append(payload)
 
 
+class SlowLight(DummyLight):
+    """Holds each write open until release is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def write_effect(self, payload):
+        self.started.set()
+        await self.release.wait()
+        self.writes.append(payload)
+
+
 @pytest.mark.asyncio
 async def test_create_orders_ids_by_xy():
     nl = DummyLight()
@@ -47,21 +71,275 @@ def test_build_anim_string_shape_basic():
     assert parts[0] == 2
     assert parts[1:8] == [1, 1, 10, 20, 30, 0, 75]
     assert parts[8:15] == [5, 1, 1, 2, 3, 0, 75]
+    # Colours may also be given positionally, in ids order.
+    assert _build_anim([1, 5], [(10, 20, 30), (1, 2, 3)], transition=75) == s
+
+
+def test_build_anim_exact_output():
+    colours = {1: (10, 20, 30), 5: (1, 2, 3)}
+    assert _build_anim([1, 5], colours, 75) == "2 1 1 10 20 30 0 75 5 1 1 2 3 0 75"
+    assert _build_anim([5], colours, -3, brightness=50) == "1 5 1 1 1 2 0 0"
+    assert _build_anim([], colours) == "0"
+    # Short or long colour tuples must not shift channels into the next panel.
+    with pytest.raises(ValueError):
+        _build_anim([1, 2], {1: (1, 2), 2: (5, 6)})
+    with pytest.raises(ValueError):
+        _build_anim([1, 2], [(1, 2, 3, 4), (5, 6, 7)])
 
 
 @pytest.mark.asyncio
 async def test_sync_default_display_and_values():
     nl = DummyLight()
     twin = await DigitalTwin.create(nl)
-    await twin.set_color(10, (255, 0, 0))
-    await twin.set_color(20, (0, 0, 300))  # clamps to 255
+    twin.set_color(10, (255, 0, 0))
+    twin.set_color(20, (0, 0, 300))  # clamps to 255
     await twin.sync(transition_ms=50)
 
     payload = nl.writes[0]
     assert payload["command"] == "display"
+    # The shared empty palette is immutable and still encodes as [].
+    assert json.loads(json.dumps(payload))["palette"] == []
+    with pytest.raises(AttributeError):
+        payload["palette"].append({"hue": 0})
     parts = list(map(int, payload["animData"].split()))
     assert parts[0] == 3
     idx = parts.index(10)
     assert parts[idx:idx + 7] == [10, 1, 255, 0, 0, 0, 50]
     idx = parts.index(20)
     assert parts[idx:idx + 7] == [20, 1, 0, 0, 255, 0, 50]
+
+
+@pytest.mark.asyncio
+async def test_colour_store_roundtrip():
+    nl = DummyLight()
+    twin = await DigitalTwin.create(nl)
+    twin.set_all_colors((1, 2, 3))
+    twin.set_color(20, (255, 128, 0))
+    assert twin.get_color(10) == (1, 2, 3)
+    assert twin.get_color(20) == (255, 128, 0)
+    assert twin.colors == {10: (1, 2, 3), 20: (255, 128, 0), 30: (1, 2, 3)}
+    # colors is read-only; get_all_colors() hands out a mutable copy.
+    with pytest.raises(TypeError):
+        twin.colors[10] = (9, 9, 9)  # type: ignore[index]
+    copy = twin.get_all_colors()
+    copy[10] = (9, 9, 9)
+    assert twin.get_color(10) == (1, 2, 3)
+    # The view is live: later edits show through without a rebuild.
+    view = twin.colors
+    twin.set_color(30, (4, 5, 6))
+    assert view[30] == (4, 5, 6)
+    assert len(view) == 3 and 20 in view and 99 not in view and "x" not in view
+
+
+@pytest.mark.asyncio
+async def test_deprecated_async_setter_aliases():
+    nl = DummyLight()
+    twin = await DigitalTwin.create(nl)
+    with pytest.deprecated_call():
+        await twin.aset_all_colors((1, 1, 1))
+    with pytest.deprecated_call():
+        await twin.aset_color(10, (2, 2, 2))
+    with pytest.deprecated_call():
+        await twin.aset_hex(20, "#030303")
+    assert twin.get_all_colors() == {10: (2, 2, 2), 20: (3, 3, 3), 30: (1, 1, 1)}
+
+
+@pytest.mark.asyncio
+async def test_sync_brightness_overlay_scales_channels():
+    nl = DummyLight()
+    twin = await DigitalTwin.create(nl)
+    twin.set_color(10, (255, 100, 1))
+    await twin.sync(only=[10], brightness=50)
+
+    parts = list(map(int, nl.writes[0]["animData"].split()))
+    assert parts == [1, 10, 1, 128, 50, 1, 0, 10]
+    assert _build_anim([10], {10: (255, 100, 1)}, 10, brightness=50) == nl.writes[0]["animData"]
+
+
+def test_validate_rgb_fast_path_and_clamping():
+    rgb = (1, 2, 3)
+    assert _validate_rgb(rgb) is rgb
+    assert _validate_rgb([0, "7", 300]) == (0, 7, 255)
+    with pytest.raises(ValueError):
+        _validate_rgb((1, 2))
+
+
+def test_hex_to_rgb_parses_and_rejects():
+    assert _hex_to_rgb("#0A0B0C") == (10, 11, 12)
+    assert _hex_to_rgb(" ff8000 ") == (255, 128, 0)
+    for bad in ("GGHHII", "#12345", "ff  00", None, ["#ffffff"]):
+        with pytest.raises(ValueError):
+            _hex_to_rgb(bad)
+
+
+@pytest.mark.asyncio
+async def test_set_colors_batch_and_unknown_ids():
+    nl = DummyLight()
+    twin = await DigitalTwin.create(nl)
+    twin.set_colors({10: (1, 2, 3), 30: (4, 5, 6)})
+    assert twin.colors == {10: (1, 2, 3), 20: (0, 0, 0), 30: (4, 5, 6)}
+
+    with pytest.raises(ValueError):
+        twin.set_colors({10: (9, 9, 9), 99: (1, 1, 1)})
+    assert twin.get_color(10) == (1, 2, 3)  # nothing written on error
+
+    twin.set_colors(bytes(range(9)))
+    assert twin.colors == {10: (0, 1, 2), 20: (3, 4, 5), 30: (6, 7, 8)}
+
+
+@pytest.mark.asyncio
+async def test_schedule_sync_coalesces_bursts():
+    nl = DummyLight()
+    twin = await DigitalTwin.create(nl)
+    for level in (10, 20, 30):
+        twin.set_all_colors((level, 0, 0))
+        twin.schedule_sync(delay_ms=5, transition_ms=0)
+    await asyncio.sleep(0.05)
+
+    assert len(nl.writes) == 1
+    assert nl.writes[0]["animData"].split()[3] == "30"
+
+
+@pytest.mark.asyncio
+async def test_display_sync_sends_only_changed_panels():
+    nl = DummyLight()
+    twin = await DigitalTwin.create(nl)
+    twin.set_all_colors((5, 5, 5))
+    await twin.sync()
+    assert nl.writes[-1]["animData"].split()[0] == "3"
+
+    twin.set_color(30, (9, 9, 9))
+    await twin.sync()
+    assert nl.writes[-1]["animData"] == "1 30 1 9 9 9 0 10"
+
+    await twin.sync()  # nothing changed: no write
+    assert len(nl.writes) == 2
+
+    await twin.sync(force=True)
+    assert len(nl.writes) == 3
+    assert nl.writes[-1]["animData"].split()[0] == "3"
+
+
+@pytest.mark.asyncio
+async def test_edit_during_slow_write_is_sent_next_sync():
+    nl = SlowLight()
+    twin = await DigitalTwin.create(nl)
+    task = asyncio.ensure_future(twin.sync())
+    await nl.started.wait()
+    twin.set_color(20, (1, 2, 3))  # lands while the write is in flight
+    nl.release.set()
+    await task
+    assert nl.writes[0]["animData"].split()[0] == "3"
+    assert " 20 1 0 0 0 " in nl.writes[0]["animData"]
+
+    twin.set_color(30, (4, 5, 6))
+    await twin.sync()
+    assert nl.writes[-1]["animData"] == "2 20 1 1 2 3 0 10 30 1 4 5 6 0 10"
+
+
+@pytest.mark.asyncio
+async def test_edit_during_write_is_not_lost_to_early_return():
+    nl = SlowLight()
+    twin = await DigitalTwin.create(nl)
+    task = asyncio.ensure_future(twin.sync())
+    await nl.started.wait()
+    twin.set_color(20, (1, 2, 3))
+    nl.release.set()
+    await task
+
+    await twin.sync()  # the only edit happened mid-write
+    assert nl.writes[-1]["animData"] == "1 20 1 1 2 3 0 10"
+
+
+@pytest.mark.asyncio
+async def test_failed_write_keeps_twin_dirty():
+    class FlakyLight(DummyLight):
+        fail = False
+
+        async def write_effect(self, payload):
+            if self.fail:
+                raise OSError("boom")
+            self.writes.append(payload)
+
+    nl = FlakyLight()
+    twin = await DigitalTwin.create(nl)
+    await twin.sync()
+    twin.set_color(10, (7, 7, 7))
+    nl.fail = True
+    with pytest.raises(OSError):
+        await twin.sync()
+    nl.fail = False
+    await twin.sync()
+    assert nl.writes[-1]["animData"] == "1 10 1 7 7 7 0 10"
+
+
+@pytest.mark.asyncio
+async def test_subset_sync_at_other_brightness_is_undone_by_next_sync():
+    nl = DummyLight()
+    twin = await DigitalTwin.create(nl)
+    twin.set_all_colors((200, 200, 200))
+    await twin.sync()
+    await twin.sync(only=[10], brightness=50)
+    assert nl.writes[-1]["animData"] == "1 10 1 100 100 100 0 10"
+
+    await twin.sync()
+    assert len(nl.writes) == 3
+    assert nl.writes[-1]["animData"] == "1 10 1 200 200 200 0 10"
+
+
+@pytest.mark.asyncio
+async def test_mark_dirty_forces_full_resend():
+    nl = DummyLight()
+    twin = await DigitalTwin.create(nl)
+    await twin.sync()
+    await twin.sync()
+    assert len(nl.writes) == 1
+
+    twin.mark_dirty()
+    await twin.sync()
+    assert len(nl.writes) == 2
+    assert nl.writes[-1]["animData"].split()[0] == "3"
+
+
+def test_brightness_fixed_point_matches_integer_rounding():
+    for bn in range(101):
+        table = _brightness_table(bn)
+        for c in range(256):
+            expected = (c * bn + 50) // 100
+            assert table[c] == expected
+            assert _apply_brightness((c, c, c), bn) == (expected,) * 3
+
+
+@pytest.mark.asyncio
+async def test_region_helpers_use_sorted_positions():
+    nl = DummyLight()
+    twin = await DigitalTwin.create(nl)
+    assert twin.ids_in_box(0, 0, 5, 0) == [10, 20]
+    assert twin.ids_by_row(10, tolerance=0) == [30]
+    assert twin.ids_by_col(4, tolerance=1) == [20]
+
+
+def test_twin_requires_an_effect_writer():
+    with pytest.raises(RuntimeError):
+        DigitalTwin(object(), [(1, 0, 0)])
+
+
+@pytest.mark.asyncio
+async def test_sync_prefers_raw_put_when_available():
+    class RawLight(DummyLight):
+        def __init__(self):
+            super().__init__()
+            self.raw = []
+
+        async def _put_raw(self, path, body):
+            self.raw.append((path, body))
+
+    nl = RawLight()
+    twin = await DigitalTwin.create(nl)
+    twin.set_color(10, (1, 2, 3))
+    await twin.sync(transition_ms=5)
+
+    assert not nl.writes
+    path, body = nl.raw[0]
+    assert path == "/effects"
+    assert json.loads(body)["write"]["animData"].startswith("3 10 1 1 2 3 0 5")
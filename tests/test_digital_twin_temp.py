@@ -7,8 +7,13 @@ try:
 except ImportError:  # pragma: no cover
     pytest = None  # type: ignore
 
+import asyncio
+
 from aionanoleaf.digital_twin import DigitalTwin
 
+# Every test in this module is a coroutine.
+pytestmark = pytest.mark.asyncio
+
 
 class DummyPanel:
     def __init__(self, pid, x, y):
@@ -44,13 +49,12 @@ class DummyLight:
         return {"ok": True}
 
 
-@pytest.mark.asyncio
 async def test_apply_temp_restores_effect(monkeypatch):
     nl = DummyLight()
     twin = await DigitalTwin.create(nl)
 
     # Program a blink colour on one panel
-    await twin.set_hex(10, "#FF0000")
+    twin.set_hex(10, "#FF0000")
 
     # Speed up test by stubbing sleep
     async def fast_sleep(_ms: int) -> None:
@@ -65,3 +69,49 @@ async def test_apply_temp_restores_effect(monkeypatch):
 
     # The previous effect should be restored
     assert nl._selected_effect == "Snowfall"
+
+
+async def test_apply_temp_still_blinks_when_effect_read_fails(monkeypatch):
+    nl = DummyLight()
+    twin = await DigitalTwin.create(nl)
+
+    async def broken_get_json(path: str):
+        raise OSError(path)
+
+    async def fast_sleep(_ms: int) -> None:
+        return None
+
+    nl._get_json = broken_get_json
+    monkeypatch.setattr(DigitalTwin, "_sleep_ms", staticmethod(fast_sleep))
+
+    await twin.apply_temp(transition_ms=10, duration_ms=10, only=[10])
+
+    # The blink goes out even though there is nothing to restore afterwards
+    assert [p["command"] for p in nl._writes] == ["displayTemp"]
+    assert nl._selected_effect == "Snowfall"
+
+
+async def test_apply_temp_reads_effect_before_temp_write(monkeypatch):
+    class TempLight(DummyLight):
+        """The device reports the temp scene as selected once it is shown."""
+
+        async def write_effect(self, payload):
+            await super().write_effect(payload)
+            if payload["command"] == "displayTemp":
+                self._selected_effect = "*Dynamic*"
+
+        async def _get_json(self, path: str):
+            await asyncio.sleep(0)  # let any concurrent write land first
+            return await super()._get_json(path)
+
+    nl = TempLight()
+    twin = await DigitalTwin.create(nl)
+
+    async def fast_sleep(_ms: int) -> None:
+        return None
+
+    monkeypatch.setattr(DigitalTwin, "_sleep_ms", staticmethod(fast_sleep))
+
+    await twin.apply_temp(transition_ms=10, duration_ms=10)
+
+    assert nl._selected_effect == "Snowfall"
@@ -1,6 +1,10 @@
 # tests/test_effects_api.py
 """Unit tests for EffectsClient (no real HTTP)."""
 
+import asyncio
+import json
+from types import MappingProxyType
+
 try:
     import pytest  # type: ignore
 except ImportError:  # pragma: no cover - lint-only environments
@@ -8,6 +12,12 @@ except ImportError:  # pragma: no cover - lint-only environments
 
 from aionanoleaf.effects import EffectsClient
 
+# Every test in this module is a coroutine.
+pytestmark = pytest.mark.asyncio
+
+# Shared, read-only write payload; write_effect must not mutate it.
+_DISPLAY_PAYLOAD = MappingProxyType({"command": "display", "animType": "static", "animData": "0"})
+
 
 class DummyNL:
     """Tiny stub exposing _get_json/_put_json like the real client does."""
@@ -27,7 +37,6 @@ class DummyNL:
         return {"ok": True}
 
 
-@pytest.mark.asyncio
 async def test_effects_list_and_select_ok():
     nl = DummyNL()
     cli = EffectsClient(nl)
@@ -38,10 +47,69 @@ async def test_effects_list_and_select_ok():
     sel = await cli.get_selected_effect()
     assert sel == "B"
 
+    assert await cli.snapshot() == (["A", "B", "C"], "B")
+
     await cli.select_effect("A")
     await cli.write_custom_effect("X", "0")
     await cli.display_temp_static("0")
+    await cli.write_effect(_DISPLAY_PAYLOAD)
+    assert nl.put_calls[-1] == ("/effects", {"write": dict(_DISPLAY_PAYLOAD)})
 
     # Ensure the right endpoint was called
     assert nl.put_calls[0][0] == "/effects"
     assert "select" in nl.put_calls[0][1] or "write" in nl.put_calls[0][1]
+
+
+async def test_reads_are_cached_until_a_write():
+    nl = DummyNL()
+    gets = []
+    get_json = nl._get_json
+
+    async def counting_get_json(path: str):
+        gets.append(path)
+        return await get_json(path)
+
+    nl._get_json = counting_get_json
+    cli = EffectsClient(nl)
+
+    assert await cli.get_effects_list() == ["A", "B", "C"]
+    assert await cli.get_effects_list() == ["A", "B", "C"]
+    assert await cli.get_selected_effect() == "B"
+    assert await cli.get_selected_effect() == "B"
+    assert gets == ["/effects/effectsList", "/effects/select"]
+
+    nl.get_map["/effects/select"] = "A"
+    await cli.select_effect("A")
+    assert await cli.get_selected_effect() == "A"
+    assert len(gets) == 3
+
+
+async def test_buffered_merges_static_writes():
+    nl = DummyNL()
+    cli = EffectsClient(nl)
+    async with cli.buffered(window_ms=5):
+        await asyncio.gather(
+            cli.write_effect({**_DISPLAY_PAYLOAD, "animData": "2 1 1 9 9 9 0 5 2 1 1 1 1 0 5"}),
+            cli.write_effect({**_DISPLAY_PAYLOAD, "animData": "1 2 1 7 7 7 0 5"}),
+            cli.write_effect({"command": "add", "animType": "custom", "animData": "0"}),
+        )
+
+    writes = [body["write"] for _, body in nl.put_calls]
+    assert writes[0]["animData"] == "2 1 1 9 9 9 0 5 2 1 7 7 7 0 5"
+    assert writes[1]["command"] == "add"
+    assert len(writes) == 2
+
+
+async def test_write_raw_with_prebuilt_payload():
+    nl = DummyNL()
+    cli = EffectsClient(nl)
+    build = EffectsClient.build_write_payload("display", "static", loop=False)
+
+    body = build("1 7 1 255 0 0 0 10")
+    assert json.loads(body) == {
+        "write": {"command": "display", "animType": "static", "loop": False, "animData": "1 7 1 255 0 0 0 10"}
+    }
+
+    # DummyNL has no _put_raw, so the body goes through _put_json decoded
+    await cli.write_raw(body)
+    assert nl.put_calls == [("/effects", json.loads(body))]
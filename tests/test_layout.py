@@ -0,0 +1,89 @@
+"""Unit tests for LayoutClient (no real HTTP)."""
+
+import copy
+import pickle
+
+try:
+    import pytest  # type: ignore
+except ImportError:  # pragma: no cover - lint-only environments
+    pytest = None  # type: ignore
+
+from aionanoleaf.layout import LayoutClient, Panel
+
+
+class DummyNL:
+    """Stub exposing _get_json/_put_json like the real client does."""
+
+    def __init__(self) -> None:
+        self.layout = {
+            "positionData": [
+                {"panelId": 7, "x": 100, "y": 50, "o": 0},
+                {"panelId": "8", "x": 0, "y": 0, "o": 60},
+                {"panelId": 9, "x": None, "y": 0},  # malformed, skipped
+            ]
+        }
+
+    async def _get_json(self, path: str):
+        assert path == "/panelLayout/layout"
+        return self.layout
+
+    async def _put_json(self, path: str, body):
+        raise AssertionError(f"unexpected PUT {path}: {body}")
+
+
+@pytest.mark.asyncio
+async def test_positions_as_dicts_and_arrays():
+    cli = LayoutClient(DummyNL())
+
+    assert await cli.get_positions() == [
+        {"panelId": 7, "x": 100, "y": 50},
+        {"panelId": 8, "x": 0, "y": 0},
+    ]
+
+    assert await cli.get_positions_tuples() == [(7, 100, 50), (8, 0, 0)]
+
+    arrays = await cli.get_positions_arrays()
+    assert arrays["ids"].tolist() == [7, 8]
+    assert arrays["x"].tolist() == [100, 0]
+    assert arrays["y"].tolist() == [50, 0]
+
+
+def test_client_requires_transport():
+    class NoTransport:
+        async def _get_json(self, path: str):
+            return path
+
+    with pytest.raises(TypeError):
+        LayoutClient(NoTransport())
+
+
+def test_panel_constructors():
+    class Obj:
+        id = 3
+        x_coordinate = 0
+        y_coordinate = "9"
+
+    for panel in (
+        Panel(3, 0, 9),
+        Panel.from_mapping({"panelId": 3, "x": 0, "y": 9, "o": 60}),
+        Panel.from_mapping({"id": "3", "x_coordinate": 0, "y_coordinate": 9}),
+        Panel.from_obj(Obj()),
+    ):
+        assert (panel.id, panel.x, panel.y) == (3, 0, 9)
+
+        assert panel == Panel(3, 0, 9)
+    assert Panel.from_any({"panelId": 3, "x": 0, "y": 9}) == Panel.from_any(Obj())
+    assert len({Panel(3, 0, 9), Panel("3", "0", "9"), Panel(4, 0, 9)}) == 2
+
+    with pytest.raises(TypeError):
+        Panel.from_mapping({"panelId": 3, "x": 0})
+
+
+def test_panel_copy_and_pickle_roundtrip():
+    panel = Panel(3, 0, 9)
+    clones = [copy.copy(panel), copy.deepcopy(panel)]
+    clones += [pickle.loads(pickle.dumps(panel, proto)) for proto in range(pickle.HIGHEST_PROTOCOL + 1)]
+    for clone in clones:
+        assert clone == panel
+        assert hash(clone) == hash(panel)
+        assert clone.id == 3
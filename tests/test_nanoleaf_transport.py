@@ -0,0 +1,97 @@
+"""Nanoleaf request plumbing against a fake session (no real HTTP)."""
+
+import json
+
+try:
+    import pytest  # type: ignore
+except ImportError:  # pragma: no cover - lint-only environments
+    pytest = None  # type: ignore
+
+from aiohttp import DummyCookieJar
+
+from aionanoleaf.nanoleaf import Nanoleaf, build_session
+
+# Every test in this module is a coroutine.
+pytestmark = pytest.mark.asyncio
+
+
+class FakeResponse:
+    def __init__(self, body: bytes = b"", status: int = 200) -> None:
+        self.status = status
+        self._body = body
+        self.released = False
+
+    def raise_for_status(self) -> None:
+        assert self.status < 400
+
+    async def read(self) -> bytes:
+        return self._body
+
+    def release(self) -> None:
+        self.released = True
+
+
+class FakeSession:
+    """Records each request() call and answers with the queued response."""
+
+    def __init__(self, body: bytes = b"") -> None:
+        self.body = body
+        self.calls = []
+        self.responses = []
+
+    async def request(self, method, url, *, data, headers, timeout):
+        del timeout
+        self.calls.append((method, str(url), data, dict(headers)))
+        resp = FakeResponse(self.body)
+        self.responses.append(resp)
+        return resp
+
+
+async def test_get_json_decodes_body_and_empty_body_is_none():
+    session = FakeSession(b'{"select": "Snowfall"}')
+    nl = Nanoleaf(session, "192.168.0.50", auth_token="tok")  # type: ignore[arg-type]
+
+    assert await nl._get_json("/effects") == {"select": "Snowfall"}
+    method, url, _, _ = session.calls[0]
+    assert (method, url) == ("get", "http://192.168.0.50:16021/api/v1/tok/effects")
+
+    session.body = b""
+    assert await nl._get_json("/effects") is None
+
+
+async def test_url_cache_resets_when_token_changes():
+    nl = Nanoleaf(FakeSession(), "192.168.0.50", auth_token="a")  # type: ignore[arg-type]
+    first = nl._url("state")
+    assert nl._url("state") is first
+
+    nl._auth_token = "b"
+    assert str(nl._url("state")) == "http://192.168.0.50:16021/api/v1/b/state"
+    assert list(nl._urls) == ["state"]
+
+
+async def test_puts_send_json_headers_and_bytes_and_release():
+    session = FakeSession()
+    nl = Nanoleaf(session, "192.168.0.50", auth_token="tok")  # type: ignore[arg-type]
+
+    assert await nl._put_json("/effects", {"select": "Snowfall"}) is None
+    assert await nl._put_raw("/effects", b'{"write":{}}') is None
+
+    (m1, u1, body1, h1), (m2, u2, body2, h2) = session.calls
+    assert m1 == m2 == "put"
+    assert u1 == u2 == "http://192.168.0.50:16021/api/v1/tok/effects"
+    assert isinstance(body1, bytes) and json.loads(body1) == {"select": "Snowfall"}
+    assert body2 == b'{"write":{}}'
+    for headers in (h1, h2):
+        assert headers["Content-Type"] == "application/json"
+        assert headers["Accept"] == "application/json"
+    assert all(resp.released for resp in session.responses)
+
+
+async def test_build_session_skips_cookies_and_limits_per_host():
+    session = build_session(limit_per_host=2)
+    try:
+        assert isinstance(session.cookie_jar, DummyCookieJar)
+        assert session.connector is not None
+        assert session.connector.limit_per_host == 2
+    finally:
+        await session.close()
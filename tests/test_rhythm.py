@@ -0,0 +1,59 @@
+"""Unit tests for RhythmClient (no real HTTP)."""
+
+try:
+    import pytest  # type: ignore
+except ImportError:  # pragma: no cover - lint-only environments
+    pytest = None  # type: ignore
+
+from aionanoleaf.rhythm import RhythmClient
+
+# Every test in this module is a coroutine.
+pytestmark = pytest.mark.asyncio
+
+
+class DummyNL:
+    """Stub exposing _get_json/_put_json like the real client does."""
+
+    def __init__(self) -> None:
+        self.rhythm = {"rhythmActive": True, "rhythmMode": "0", "rhythmPos": 12}
+        self.gets = 0
+
+    async def _get_json(self, path: str):
+        assert path == "/rhythm"
+        self.gets += 1
+        return dict(self.rhythm)
+
+    async def _put_json(self, path: str, body):
+        assert path == "/rhythm"
+        self.rhythm.update(body)
+
+
+async def test_reads_share_one_fetch_until_set_mode():
+    nl = DummyNL()
+    rh = RhythmClient(nl)
+
+    assert await rh.snapshot() == (True, 0, 12)
+    assert await rh.is_active() is True
+    assert await rh.get_mode() == 0
+    assert nl.gets == 1
+
+    await rh.set_mode("aux")
+    assert await rh.get_mode() == 1
+    assert nl.gets == 2
+
+
+async def test_set_mode_variants():
+    nl = DummyNL()
+    rh = RhythmClient(nl)
+
+    await rh.set_mode_name(" Microphone ")
+    assert nl.rhythm["rhythmMode"] == 0
+    await rh.set_mode("AUX")
+    assert nl.rhythm["rhythmMode"] == 1
+    await rh.set_mode_int(0)
+    assert nl.rhythm["rhythmMode"] == 0
+
+    with pytest.raises(ValueError):
+        await rh.set_mode("line-in")
+    with pytest.raises(ValueError):
+        await rh.set_mode_int(2)